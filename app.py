@@ -1,19 +1,31 @@
 import streamlit as st
 import json
 import pandas as pd
+import uuid
+import re
+import hashlib
 from datetime import datetime
 
 # Import dari file konfigurasi
-from config import GOOGLE_API_KEY, get_gemini_model
+from config import GOOGLE_API_KEY, CASSETTE_MODE, get_gemini_model
 
 # Import fungsi-fungsi utilitas
 from utils.pdf_utils import generate_pdf_from_text, generate_analysis_pdf
 from utils.gemini_utils import generate_narrative, generate_analysis_data
+from utils.export_utils import build_export_document, export_bundle
+from utils.history_utils import save_history_entry, list_history, load_history_entry
+from utils.cache_utils import make_cache_key, get_cached_result, has_cached_result, is_result_cache_enabled
+from utils.warmup_utils import load_manifest, prime_rendering
 from utils.sidebar_content import render_custom_sidebar_content, render_sidebar_expander_content
 
 # --- Konfigurasi API dan Model ---
+# Client model dibuat sekali per proses server, bukan di setiap rerun
+@st.cache_resource(show_spinner=False)
+def load_gemini_model():
+    return get_gemini_model()
+
 try:
-    gemini_model = get_gemini_model()
+    gemini_model = load_gemini_model()
 except Exception as e:
     st.error(f"Maaf, kami mengalami masalah teknis. Silakan coba lagi nanti atau hubungi pengembang.")
     st.stop()
@@ -25,10 +37,25 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# --- Startup Hook: muat font, style PDF, dan renderer ekspor sekali per proses ---
+@st.cache_resource(show_spinner=False)
+def warm_up_app():
+    try:
+        prime_rendering()
+    except Exception as e:
+        print(f"Error priming renderers: {e}")
+    return True
+
+warm_up_app()
+
 # --- Load Custom CSS (Hanya di app.py yang pertama kali memuatnya, tapi akan dimuat ulang di setiap halaman `pages/` juga) ---
-def load_css(file_name):
+@st.cache_data(show_spinner=False)
+def read_css(file_name):
     with open(file_name) as f:
-        st.markdown(f'<style>{f.read()}</style>', unsafe_allow_html=True)
+        return f.read()
+
+def load_css(file_name):
+    st.markdown(f'<style>{read_css(file_name)}</style>', unsafe_allow_html=True)
 
 load_css('assets/style.css')
 
@@ -46,6 +73,76 @@ if 'narasi_file_name' not in st.session_state:
     st.session_state.narasi_file_name = ""
 if 'analisis_file_name' not in st.session_state:
     st.session_state.analisis_file_name = ""
+if 'result_title' not in st.session_state:
+    st.session_state.result_title = "" # Judul objek hasil aktif, dipakai saat ZIP diminta
+if 'history_page' not in st.session_state:
+    st.session_state.history_page = 0
+
+# --- Identitas Pengguna untuk Riwayat ---
+def get_logged_in_user_id():
+    # Jika login Streamlit (st.user) aktif, riwayat diikat ke akun, bukan ke tautan
+    user_info = getattr(st, "user", None)
+    try:
+        if user_info is not None and user_info.get("is_logged_in") and user_info.get("email"):
+            return "user-" + hashlib.sha256(user_info.get("email").encode("utf-8")).hexdigest()
+    except Exception:
+        pass
+    return None
+
+def get_link_user_id():
+    # Tanpa login, id disimpan di URL (?uid=...); hanya format uuid4().hex yang diterima
+    uid = st.query_params.get("uid", "")
+    if re.fullmatch(r"[0-9a-f]{32}", uid or ""):
+        return uid
+    return uuid.uuid4().hex
+
+if 'user_id' not in st.session_state:
+    st.session_state.user_id = get_logged_in_user_id() or get_link_user_id()
+    st.session_state.history_via_link = not st.session_state.user_id.startswith("user-")
+if st.session_state.history_via_link:
+    st.query_params["uid"] = st.session_state.user_id
+
+# --- Fungsi Pembantu Hasil ---
+def build_export_zip(judul_objek):
+    # Ekspor multi-format (HTML, Markdown, DOCX, PDF) dalam satu ZIP; hanya dibuat saat diminta
+    # dan tidak disimpan di session state. Mengembalikan file ZIP atau None jika gagal.
+    try:
+        export_document = build_export_document(
+            judul_objek, st.session_state.generated_narration, st.session_state.generated_analysis
+        )
+        export_zip, export_stats = export_bundle(export_document, f"Nusantara_Story_{judul_objek}")
+    except Exception as e:
+        print(f"Error generating export bundle: {e}")
+        return None
+    failed_formats = [name for name, stats in export_stats.items() if "error" in stats]
+    if failed_formats:
+        st.warning(f"Sebagian format gagal dibuat dan tidak ada di ZIP: {', '.join(failed_formats)}.")
+    return export_zip
+
+def restore_history_entry(entry_id):
+    # Memulihkan hasil lama dari riwayat tanpa memanggil model; PDF dan ZIP dibuat ulang secara lokal
+    try:
+        entry = load_history_entry(st.session_state.user_id, entry_id)
+    except Exception as e:
+        print(f"Error loading history entry {entry_id}: {e}")
+        st.session_state.history_restore_error = "Maaf, entri riwayat ini tidak dapat dipulihkan saat ini. Silakan coba lagi nanti."
+        return
+    if not entry:
+        st.session_state.history_restore_error = "Entri riwayat tidak ditemukan. Mungkin sudah terhapus karena kuota."
+        return
+
+    judul_objek = entry["judul_objek"]
+    st.session_state.generated_narration = entry["narrative"]
+    st.session_state.generated_analysis = entry["analysis"]
+
+    st.session_state.narasi_pdf_bytes = generate_pdf_from_text(entry["narrative"], f"Narasi_{judul_objek}")
+    st.session_state.narasi_file_name = f"Kisah_{judul_objek}.pdf" if st.session_state.narasi_pdf_bytes else ""
+    if entry["analysis"]:
+        st.session_state.analisis_pdf_bytes = generate_analysis_pdf(entry["analysis"], f"Analisis_{judul_objek}")
+    else:
+        st.session_state.analisis_pdf_bytes = None
+    st.session_state.analisis_file_name = f"Analisis_Promosi_{judul_objek}.pdf" if st.session_state.analisis_pdf_bytes else ""
+    st.session_state.result_title = judul_objek
 
 
 # --- Sidebar ---
@@ -59,6 +156,48 @@ st.title("Nusantara Story: Menggali Kisah Budaya, Memicu Potensi Wisata 🗺️"
 st.markdown("Jelajahi potensi tak terbatas budaya dan pariwisata lokal Anda. Aplikasi ini dirancang untuk membantu Anda merangkai **narasi yang memikat** dan **strategi promosi cerdas**, didukung oleh kecerdasan buatan **Gemini-2.5 Flash** dan **IBM Granite**.")
 st.markdown("---")
 
+# --- Tombol Contoh: mengisi form dengan input yang sama persis seperti di warmup_manifest.json ---
+@st.cache_data(show_spinner=False)
+def load_example_manifest():
+    try:
+        return load_manifest()
+    except Exception as e:
+        print(f"Error loading warm-up manifest: {e}")
+        return []
+
+def fill_example(example):
+    st.session_state.input_judul = example["judul_objek"]
+    st.session_state.input_lokasi = example["lokasi_objek"]
+    st.session_state.input_deskripsi = example["deskripsi_kunci"]
+    st.session_state.input_target = example.get("target_audiens", "")
+    st.session_state.select_gaya = example.get("gaya_bahasa", "Pilih Gaya")
+
+def get_warm_examples():
+    # Hanya contoh yang hasilnya sudah disiapkan warmup.py (dan masih berlaku) yang ditampilkan
+    if not is_result_cache_enabled(CASSETTE_MODE):
+        return []
+    warm_examples = []
+    for example in load_example_manifest():
+        try:
+            example_key = make_cache_key(
+                example["judul_objek"], example["lokasi_objek"], example["deskripsi_kunci"],
+                example.get("target_audiens", ""), example.get("gaya_bahasa", "Pilih Gaya")
+            )
+            if has_cached_result(example_key):
+                warm_examples.append(example)
+        except Exception as e:
+            print(f"Error checking warm-up cache for {example.get('judul_objek')}: {e}")
+    return warm_examples
+
+example_entries = get_warm_examples()
+if example_entries:
+    st.markdown('<p style="font-weight: 600; color: #555555; margin-bottom: 5px;">Coba Contoh Populer (hasil langsung tersedia)</p>', unsafe_allow_html=True)
+    example_columns = st.columns(len(example_entries))
+    for example_column, example in zip(example_columns, example_entries):
+        with example_column:
+            st.button(example["judul_objek"], key=f"example_{example['judul_objek']}",
+                      on_click=fill_example, args=(example,), use_container_width=True)
+
 # Menggunakan st.form untuk input agar tidak langsung rerun saat input berubah
 with st.form("story_generation_form"):
     col_input1, col_input2 = st.columns(2)
@@ -79,7 +218,7 @@ with st.form("story_generation_form"):
         st.markdown('<p class="custom-help-text">Pilih nuansa dan gaya penulisan yang Anda inginkan untuk narasi.</p>', unsafe_allow_html=True)
 
         st.markdown('<p style="font-weight: 600; color: #555555; margin-bottom: 5px;">Target Audiens Utama (Opsional)</p>', unsafe_allow_html=True)
-        target_audiens = st.text_input("", value="", placeholder="Contoh: Wisatawan Keluarga, Pecinta Sejarah, Penggemar Kopi", key="input_target", label_visibility="collapsed")
+        target_audiens = st.text_input("", placeholder="Contoh: Wisatawan Keluarga, Pecinta Sejarah, Penggemar Kopi", key="input_target", label_visibility="collapsed")
         st.markdown('<p class="custom-help-text">Siapa target utama pesan promosi ini? (Misal: anak muda, keluarga, turis asing).</p>', unsafe_allow_html=True)
 
     st.markdown('<p style="font-weight: 600; color: #555555; margin-bottom: 5px;">Deskripsi Singkat / Poin-poin Kunci / Fakta Sejarah <span style="color:red">*</span></p>', unsafe_allow_html=True)
@@ -89,6 +228,8 @@ with st.form("story_generation_form"):
     st.markdown('<p class="custom-help-text">Ini adalah informasi inti untuk Kami merangkai cerita. Beri detail sebanyak mungkin!</p>', unsafe_allow_html=True)
 
 
+    bypass_cache = st.checkbox("Buat versi baru (jangan pakai hasil contoh yang sudah disiapkan)", key="input_bypass_cache")
+
     # --- Tombol Generate di dalam form ---
     submit_button = st.form_submit_button("Mulai Rangkai Kisah & Optimalkan Promosi! ✨", type="primary")
 
@@ -103,6 +244,7 @@ if submit_button:
         st.session_state.analisis_pdf_bytes = None
         st.session_state.narasi_file_name = ""
         st.session_state.analisis_file_name = ""
+        st.session_state.result_title = ""
     else:
         # Hapus hasil sebelumnya dari session state untuk memastikan hasil baru
         st.session_state.generated_narration = ""
@@ -111,6 +253,16 @@ if submit_button:
         st.session_state.analisis_pdf_bytes = None
         st.session_state.narasi_file_name = ""
         st.session_state.analisis_file_name = ""
+        st.session_state.result_title = ""
+
+        # --- Cek cache contoh populer (hanya diisi oleh warmup.py saat deploy) ---
+        cached_result = {}
+        if not bypass_cache and is_result_cache_enabled(CASSETTE_MODE):
+            cache_key = make_cache_key(judul_objek, lokasi_objek, deskripsi_kunci, target_audiens, gaya_bahasa)
+            try:
+                cached_result = get_cached_result(cache_key) or {}
+            except Exception as e:
+                print(f"Error reading result cache: {e}")
 
         # --- Tahap 1: Generasi Narasi oleh Gemini ---
         # HILANGKAN st.subheader dan narasi_placeholder DI SINI
@@ -118,7 +270,7 @@ if submit_button:
         # narasi_placeholder = st.empty()
 
         with st.spinner("Kami sedang menyusun narasi memukau untuk Anda... Sabar ya! ⏳"):
-            generated_narration = generate_narrative(
+            generated_narration = cached_result.get("narrative") or generate_narrative(
                 gemini_model, judul_objek, lokasi_objek, deskripsi_kunci, target_audiens, gaya_bahasa
             )
 
@@ -126,7 +278,7 @@ if submit_button:
                 st.session_state.generated_narration = generated_narration # Simpan ke session state
 
                 # Generate PDF bytes dan simpan juga ke session state
-                pdf_bytes_narasi_temp = generate_pdf_from_text(generated_narration, f"Narasi_{judul_objek}")
+                pdf_bytes_narasi_temp = cached_result.get("narasi_pdf") or generate_pdf_from_text(generated_narration, f"Narasi_{judul_objek}")
                 if pdf_bytes_narasi_temp:
                     st.session_state.narasi_pdf_bytes = pdf_bytes_narasi_temp
                     st.session_state.narasi_file_name = f"Kisah_{judul_objek}.pdf"
@@ -143,13 +295,13 @@ if submit_button:
         # --- Tahap 2: Analisis & Optimasi oleh Gemini ---
         if st.session_state.generated_narration: 
             with st.spinner("Kami sedang menganalisis potensi tak terbatas destinasi Anda... Mohon tunggu! 🚀"):
-                analysis_data = generate_analysis_data(gemini_model, lokasi_objek, st.session_state.generated_narration)
+                analysis_data = cached_result.get("analysis") or generate_analysis_data(gemini_model, lokasi_objek, st.session_state.generated_narration)
 
                 if analysis_data:
                     st.session_state.generated_analysis = analysis_data # Simpan ke session state
                     
                     # Generate PDF bytes untuk analisis dan simpan juga ke session state
-                    pdf_bytes_analysis_temp = generate_analysis_pdf(analysis_data, f"Analisis_{judul_objek}")
+                    pdf_bytes_analysis_temp = cached_result.get("analisis_pdf") or generate_analysis_pdf(analysis_data, f"Analisis_{judul_objek}")
                     if pdf_bytes_analysis_temp:
                         st.session_state.analisis_pdf_bytes = pdf_bytes_analysis_temp
                         st.session_state.analisis_file_name = f"Analisis_Promosi_{judul_objek}.pdf"
@@ -165,6 +317,21 @@ if submit_button:
         else:
             st.warning("Analisis tidak dapat dilakukan karena narasi belum berhasil dibuat.")
 
+        # --- Tahap 3: Ekspor multi-format & simpan ke riwayat pengguna ---
+        if st.session_state.generated_narration:
+            st.session_state.result_title = judul_objek
+            if cached_result:
+                # Contoh yang sudah disiapkan selalu tersedia, jadi tidak perlu disimpan lagi ke riwayat
+                st.info("Ini adalah hasil contoh yang sudah disiapkan. Centang \"Buat versi baru\" lalu kirim ulang untuk mendapatkan narasi baru.")
+            else:
+                try:
+                    save_history_entry(
+                        st.session_state.user_id, judul_objek, lokasi_objek, target_audiens, gaya_bahasa,
+                        st.session_state.generated_narration, st.session_state.generated_analysis
+                    )
+                except Exception as e:
+                    print(f"Error saving history entry: {e}")
+
 # --- Tampilkan Hasil dan Tombol Unduh (di luar blok `if submit_button`) ---
 # Bagian ini adalah SATU-SATUNYA tempat hasil dan tombol download akan muncul
 
@@ -236,6 +403,68 @@ if st.session_state.generated_analysis:
             help="Dapatkan dokumen analisis lengkap untuk panduan promosi Anda!"
         )
 
+# Tombol Unduh Semua Format (ZIP) - ZIP baru dibuat saat pengguna memintanya
+if st.session_state.generated_narration and st.session_state.result_title:
+    if st.button("Siapkan Semua Format (HTML, Markdown, DOCX, PDF) 📦", key="prepare_export_zip"):
+        with st.spinner("Menyiapkan arsip ZIP..."):
+            export_zip = build_export_zip(st.session_state.result_title)
+        if export_zip:
+            with export_zip:
+                st.download_button(
+                    label="Unduh Semua Format (ZIP) ⬇️",
+                    data=export_zip,
+                    file_name=f"Nusantara_Story_{st.session_state.result_title}.zip",
+                    mime="application/zip",
+                    key="download_export_zip_final", # Key unik
+                    help="Satu arsip ZIP berisi naskah siap tempel untuk media sosial, website, dan cetak."
+                )
+        else:
+            st.error("Gagal membuat arsip ZIP.")
+
+# --- Riwayat Generasi Pengguna ---
+HISTORY_PAGE_SIZE = 5
+try:
+    history_entries, history_total = list_history(
+        st.session_state.user_id, st.session_state.history_page, HISTORY_PAGE_SIZE
+    )
+    if not history_entries and st.session_state.history_page > 0:
+        # Halaman aktif kosong (misal setelah entri lama tergusur kuota), kembali ke halaman pertama
+        st.session_state.history_page = 0
+        history_entries, history_total = list_history(st.session_state.user_id, 0, HISTORY_PAGE_SIZE)
+except Exception as e:
+    print(f"Error loading history: {e}")
+    history_entries, history_total = [], 0
+
+if history_total:
+    st.markdown("---")
+    with st.expander(f"📚 Riwayat Generasi Anda ({history_total})"):
+        if st.session_state.get("history_restore_error"):
+            st.warning(st.session_state.pop("history_restore_error"))
+        st.caption("Pulihkan hasil sebelumnya tanpa menunggu AI lagi.")
+        if st.session_state.history_via_link:
+            st.caption("🔒 Tautan halaman ini bersifat pribadi: siapa pun yang memilikinya bisa melihat dan memulihkan riwayat Anda. Simpan untuk diri sendiri dan jangan dibagikan.")
+        for entry in history_entries:
+            col_history_info, col_history_button = st.columns([4, 1])
+            with col_history_info:
+                st.markdown(f"**{entry['judul_objek']}** — {entry['lokasi_objek']}")
+                st.caption(f"{entry['created_at'].replace('T', ' ')} · Gaya: {entry['gaya_bahasa']} · Audiens: {entry['target_audiens'] or 'Umum'}")
+            with col_history_button:
+                st.button("Pulihkan ↩️", key=f"restore_history_{entry['id']}",
+                          on_click=restore_history_entry, args=(entry['id'],))
+
+        history_pages = (history_total + HISTORY_PAGE_SIZE - 1) // HISTORY_PAGE_SIZE
+        if history_pages > 1:
+            col_prev, col_page, col_next = st.columns([1, 2, 1])
+            with col_prev:
+                if st.button("⬅️ Sebelumnya", key="history_prev", disabled=st.session_state.history_page == 0):
+                    st.session_state.history_page -= 1
+                    st.rerun()
+            with col_page:
+                st.markdown(f"<p style='text-align: center;'>Halaman {st.session_state.history_page + 1} dari {history_pages}</p>", unsafe_allow_html=True)
+            with col_next:
+                if st.button("Berikutnya ➡️", key="history_next", disabled=st.session_state.history_page >= history_pages - 1):
+                    st.session_state.history_page += 1
+                    st.rerun()
 
 # --- Footer Copyright ---
 st.markdown("---")
@@ -0,0 +1,52 @@
+# benchmark_export.py
+# Mengukur waktu render dan ukuran file per format ekspor dari respons yang terekam di cassette Gemini.
+# Contoh: python benchmark_export.py --cassette cassettes/gemini.jsonl.gz --rounds 3
+import argparse
+import json
+import sys
+
+from utils.cassette_utils import load_cassette_entries
+from utils.export_utils import build_export_document, benchmark_bundle, benchmark_exports
+from utils.gemini_utils import parse_analysis_json
+
+def documents_from_cassette(cassette_path):
+    """
+    Memasangkan setiap respons analisis dengan narasi yang dianalisisnya
+    (prompt analisis memuat teks narasi secara utuh) lalu membangun dokumen ekspor.
+    """
+    narratives = []
+    documents = []
+    for entry in load_cassette_entries(cassette_path):
+        try:
+            analysis = parse_analysis_json(entry["text"])
+        except json.JSONDecodeError:
+            analysis = None
+        if not isinstance(analysis, dict):
+            narratives.append(entry["text"])
+            continue
+        narrative = next((text for text in narratives if text in entry["prompt"]), "")
+        documents.append(build_export_document("Benchmark Ekspor", narrative, analysis))
+    return documents
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark waktu dan ukuran per format ekspor.")
+    parser.add_argument("--cassette", default="cassettes/gemini.jsonl.gz", help="File cassette hasil mode record.")
+    parser.add_argument("--rounds", type=int, default=3, help="Jumlah pengulangan untuk setiap dokumen.")
+    args = parser.parse_args()
+
+    documents = documents_from_cassette(args.cassette)
+    if not documents:
+        print("Tidak ada pasangan narasi/analisis di cassette.")
+        return 1
+
+    results = benchmark_exports(documents, rounds=args.rounds)
+    print(f"{len(documents)} dokumen x {args.rounds} putaran (rata-rata per dokumen)")
+    for name, stats in results.items():
+        print(f"{name:>9}  {stats['seconds']:>8.4f}s  {stats['bytes']:>9} bytes")
+
+    bundle_results = benchmark_bundle(documents, rounds=args.rounds)
+    print(f"ZIP berurutan: {bundle_results['sequential']:.4f}s, paralel: {bundle_results['parallel']:.4f}s")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
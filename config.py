@@ -3,15 +3,36 @@ import streamlit as st
 import google.generativeai as genai
 import os
 
+from utils.cassette_utils import wrap_model_with_cassette
+
+# Mode cassette Gemini untuk benchmark offline: "record", "replay", atau kosong (normal)
+CASSETTE_MODE = os.environ.get("NUSANTARA_CASSETTE_MODE", "").strip().lower()
+CASSETTE_PATH = os.environ.get("NUSANTARA_CASSETTE_PATH", "cassettes/gemini.jsonl.gz")
+
 # Google Gemini API Key
 # Mengambil dari Streamlit Cloud Secrets atau environment variable lokal
 try:
     GOOGLE_API_KEY = st.secrets["GOOGLE_API_KEY"]
 except KeyError:
-    st.error("Google Gemini API key tidak ditemukan di Streamlit Secrets. Pastikan sudah diatur.")
-    st.stop()
+    # Mode replay tidak memanggil API sama sekali, jadi API key boleh kosong
+    if CASSETTE_MODE != "replay":
+        st.error("Google Gemini API key tidak ditemukan di Streamlit Secrets. Pastikan sudah diatur.")
+        st.stop()
+    GOOGLE_API_KEY = None
+
+def _create_gemini_model():
+    genai.configure(api_key=GOOGLE_API_KEY)
+    return genai.GenerativeModel('gemini-2.5-flash')
+
+def _get_cassette_latency_scale():
+    # Nilai tidak valid tidak boleh menggagalkan aplikasi; kembali ke latensi asli (1.0)
+    raw_scale = os.environ.get("NUSANTARA_CASSETTE_LATENCY_SCALE", "1.0")
+    try:
+        return float(raw_scale)
+    except ValueError:
+        print(f"NUSANTARA_CASSETTE_LATENCY_SCALE tidak valid ({raw_scale!r}), memakai 1.0.")
+        return 1.0
 
 # Fungsi untuk mendapatkan model Gemini yang dikonfigurasi
 def get_gemini_model():
-    genai.configure(api_key=GOOGLE_API_KEY)
-    return genai.GenerativeModel('gemini-2.5-flash')
\ No newline at end of file
+    return wrap_model_with_cassette(_create_gemini_model, CASSETTE_MODE, CASSETTE_PATH, _get_cassette_latency_scale())
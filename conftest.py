@@ -0,0 +1,9 @@
+# conftest.py
+# Berada di root repo agar pytest menambahkan root ke sys.path, sehingga `utils` bisa diimpor dari tests/.
+
+import pytest
+
+@pytest.fixture
+def db_path(tmp_path):
+    # Path database SQLite sementara untuk tes riwayat dan cache
+    return str(tmp_path / "test.sqlite3")
@@ -0,0 +1,47 @@
+# tests/test_cache_utils.py
+from utils import cache_utils
+from utils.cache_utils import (
+    make_cache_key, get_cached_result, has_cached_result, store_cached_result, is_result_cache_enabled
+)
+
+def test_cache_key_ignores_case_and_spacing():
+    assert make_cache_key("Kopi Gayo", "Aceh  Tengah", "desk", "", "Pilih Gaya") == \
+        make_cache_key(" kopi gayo", "aceh tengah", "Desk ", "", "pilih gaya")
+
+def test_store_and_get_round_trip(db_path):
+    store_cached_result("k1", "Bromo", "narasi", {"a": 1}, narasi_pdf=b"pdf", db_path=db_path)
+
+    result = get_cached_result("k1", db_path=db_path)
+    assert result["narrative"] == "narasi"
+    assert result["analysis"] == {"a": 1}
+    assert result["narasi_pdf"] == b"pdf"
+    assert result["analisis_pdf"] is None
+
+def test_expired_entries_are_ignored(db_path):
+    store_cached_result("k1", "Bromo", "narasi", {}, db_path=db_path)
+    assert get_cached_result("k1", db_path=db_path, ttl_seconds=-1) is None
+
+def test_row_cap_keeps_newest(db_path):
+    for i in range(4):
+        store_cached_result(f"k{i}", "Objek", f"narasi {i}", {}, db_path=db_path, max_rows=2)
+
+    assert get_cached_result("k0", db_path=db_path) is None
+    assert get_cached_result("k1", db_path=db_path) is None
+    assert get_cached_result("k3", db_path=db_path)["narrative"] == "narasi 3"
+
+def test_cache_disabled_by_env_or_cassette_mode(monkeypatch):
+    monkeypatch.delenv("NUSANTARA_RESULT_CACHE", raising=False)
+    assert is_result_cache_enabled()
+    assert not is_result_cache_enabled("replay")
+    monkeypatch.setenv("NUSANTARA_RESULT_CACHE", "0")
+    assert not is_result_cache_enabled()
+
+def test_has_cached_result_respects_ttl(db_path):
+    assert not has_cached_result("k1", db_path=db_path)
+    store_cached_result("k1", "Bromo", "narasi", {}, db_path=db_path)
+    assert has_cached_result("k1", db_path=db_path)
+    assert not has_cached_result("k1", db_path=db_path, ttl_seconds=-1)
+
+def test_malformed_limit_env_falls_back_to_default(monkeypatch):
+    monkeypatch.setenv("NUSANTARA_RESULT_CACHE_TTL_SECONDS", "seminggu")
+    assert cache_utils._ttl_seconds() == cache_utils.DEFAULT_TTL_SECONDS
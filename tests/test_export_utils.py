@@ -0,0 +1,62 @@
+# tests/test_export_utils.py
+import zipfile
+
+from utils.export_utils import build_export_document, export_bundle, benchmark_exports
+
+def test_build_export_document_normalizes_analysis_items():
+    analysis = {
+        "Poin Jual Utama": ["Matahari terbit", {"poin": None, "deskripsi": "Lautan pasir"}, None],
+        "Segmen Wisatawan Ideal": "Fotografer",
+    }
+    document = build_export_document("Bromo", "Paragraf satu\n\nParagraf dua", analysis)
+
+    sections = {section["heading"]: section for section in document["sections"]}
+    assert sections["Kisah & Narasi"]["paragraphs"] == ["Paragraf satu", "Paragraf dua"]
+    assert sections["Poin Jual Utama"]["items"] == [("Matahari terbit", ""), ("", "Lautan pasir")]
+    assert sections["Segmen Wisatawan Ideal"]["items"] == [("Fotografer", "")]
+
+def test_export_bundle_renders_all_formats_with_flat_names():
+    analysis = {"Poin Jual Utama": [{"poin": None, "deskripsi": None}, "Teks biasa"]}
+    document = build_export_document("Bromo/Test", "Narasi <Bromo> & Tengger", analysis)
+
+    bundle, stats = export_bundle(document, "Nusantara_Story_Bromo/Test", formats=["html", "markdown", "pdf"])
+    with bundle:
+        names = zipfile.ZipFile(bundle).namelist()
+
+    assert not any("error" in format_stats for format_stats in stats.values())
+    assert sorted(names) == [
+        "Nusantara_Story_Bromo_Test.html",
+        "Nusantara_Story_Bromo_Test.md",
+        "Nusantara_Story_Bromo_Test.pdf",
+    ]
+
+def test_benchmark_exports_reports_seconds_and_bytes():
+    document = build_export_document("Bromo", "Narasi", {})
+    results = benchmark_exports([document], formats=["html", "markdown"], rounds=2)
+
+    assert set(results) == {"html", "markdown"}
+    assert all(stats["bytes"] > 0 and stats["seconds"] >= 0 for stats in results.values())
+
+def _rendered_text(document, format_name):
+    bundle, _ = export_bundle(document, "hasil", formats=[format_name])
+    with bundle:
+        archive = zipfile.ZipFile(bundle)
+        return archive.read(archive.namelist()[0]).decode("utf-8")
+
+def test_renderers_skip_bold_label_for_incomplete_items():
+    analysis = {"Poin Jual Utama": ["Teks biasa", {"poin": None, "deskripsi": "Hanya deskripsi"},
+                                     {"poin": "Judul", "deskripsi": "Isi"}, {"poin": None, "deskripsi": None}]}
+    document = build_export_document("Bromo", "", analysis)
+
+    markdown = _rendered_text(document, "markdown")
+    assert "- Teks biasa\n" in markdown
+    assert "- Hanya deskripsi\n" in markdown
+    assert "- **Judul**: Isi\n" in markdown
+    assert "****" not in markdown and "**: \n" not in markdown
+
+    html_text = _rendered_text(document, "html")
+    assert "<li>Teks biasa</li>" in html_text
+    assert "<li>Hanya deskripsi</li>" in html_text
+    assert "<li><strong>Judul</strong>: Isi</li>" in html_text
+    assert "<strong></strong>" not in html_text
+    assert html_text.count("<li>") == 3
@@ -0,0 +1,75 @@
+# tests/test_history_utils.py
+import zlib
+
+from utils import history_utils
+from utils.history_utils import save_history_entry, list_history, load_history_entry
+
+def _save(db_path, user_id, judul_objek, narrative="narasi", **kwargs):
+    return save_history_entry(
+        user_id, judul_objek, "Jawa Timur", "", "Puitis",
+        narrative, {"Poin Jual Utama": [{"poin": "a", "deskripsi": "b"}]},
+        db_path=db_path, **kwargs
+    )
+
+def test_quota_keeps_newest_entries(db_path):
+    for i in range(7):
+        _save(db_path, "u1", f"Objek {i}", max_entries=5)
+
+    entries, total = list_history("u1", 0, 10, db_path=db_path)
+    assert total == 5
+    assert [e["judul_objek"] for e in entries] == [f"Objek {i}" for i in range(6, 1, -1)]
+
+def test_byte_quota_never_evicts_latest_entry(db_path):
+    _save(db_path, "u1", "Lama")
+    _save(db_path, "u1", "Baru", narrative="narasi panjang " * 200, max_bytes=1)
+
+    entries, total = list_history("u1", 0, 10, db_path=db_path)
+    assert total == 1
+    assert entries[0]["judul_objek"] == "Baru"
+
+def test_pagination_and_user_isolation(db_path):
+    ids = [_save(db_path, "u1", f"Objek {i}") for i in range(3)]
+    _save(db_path, "u2", "Milik orang lain")
+
+    page, total = list_history("u1", 1, 2, db_path=db_path)
+    assert total == 3
+    assert [e["id"] for e in page] == [ids[0]]
+    assert "payload" not in page[0]
+
+    entry = load_history_entry("u1", ids[0], db_path=db_path)
+    assert entry["narrative"] == "narasi"
+    assert entry["analysis"]["Poin Jual Utama"][0]["poin"] == "a"
+    assert load_history_entry("u2", ids[0], db_path=db_path) is None
+
+def test_zlib_fallback_round_trip(db_path, monkeypatch):
+    monkeypatch.setattr(history_utils, "zstandard", None)
+    entry_id = _save(db_path, "u1", "Objek", narrative="narasi " * 100)
+
+    entries, _ = list_history("u1", 0, 1, db_path=db_path)
+    assert entries[0]["stored_size"] < entries[0]["raw_size"]
+    assert load_history_entry("u1", entry_id, db_path=db_path)["narrative"] == "narasi " * 100
+    assert history_utils._decompress("zlib", zlib.compress(b"x")) == b"x"
+
+def test_global_byte_cap_evicts_oldest_across_users(db_path):
+    first_id = _save(db_path, "u1", "Lama", narrative="narasi satu " * 50)
+    _save(db_path, "u2", "Tengah", narrative="narasi dua " * 50)
+    newest_id = _save(db_path, "u3", "Baru", narrative="narasi tiga " * 50, max_total_bytes=1)
+
+    assert load_history_entry("u1", first_id, db_path=db_path) is None
+    assert list_history("u2", 0, 10, db_path=db_path)[1] == 0
+    assert load_history_entry("u3", newest_id, db_path=db_path)["judul_objek"] == "Baru"
+
+def test_global_age_limit_removes_abandoned_histories(db_path):
+    old_id = _save(db_path, "abandoned", "Lama")
+    conn = history_utils._connect(db_path)
+    with conn:
+        conn.execute("UPDATE history SET created_at = '2000-01-01T00:00:00' WHERE id = ?", (old_id,))
+    conn.close()
+
+    _save(db_path, "u1", "Baru", max_age_days=30)
+    assert list_history("abandoned", 0, 10, db_path=db_path)[1] == 0
+    assert list_history("u1", 0, 10, db_path=db_path)[1] == 1
+
+def test_malformed_limit_env_falls_back_to_default(monkeypatch):
+    monkeypatch.setenv("NUSANTARA_HISTORY_MAX_ENTRIES", "banyak")
+    assert history_utils._history_limits()["max_entries"] == history_utils.DEFAULT_MAX_ENTRIES
@@ -0,0 +1,143 @@
+# utils/cache_utils.py
+import hashlib
+import json
+import os
+import time
+import zlib
+from datetime import datetime
+
+from utils.storage_utils import connect_sqlite, env_int
+
+# Cache hasil contoh populer (narasi, analisis, dan PDF) yang diisi oleh warmup.py saat deploy.
+# Generasi biasa dari pengguna tidak pernah disimpan di sini.
+RESULT_CACHE_DB_PATH = os.environ.get("NUSANTARA_RESULT_CACHE_DB_PATH", "data/result_cache.sqlite3")
+
+# Batas cache dibaca dari environment variable saat dipakai (NUSANTARA_RESULT_CACHE_TTL_SECONDS,
+# NUSANTARA_RESULT_CACHE_MAX_ROWS); nilai tidak valid kembali ke default ini
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_MAX_ROWS = 100
+
+SOURCE_WARMUP = "warmup"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS warmup_results (
+    cache_key TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    created_ts REAL NOT NULL,
+    judul_objek TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    narasi_pdf BLOB,
+    analisis_pdf BLOB
+);
+"""
+
+def is_result_cache_enabled(cassette_mode=""):
+    """
+    Cache bisa dimatikan lewat NUSANTARA_RESULT_CACHE=0, dan selalu mati saat mode cassette
+    aktif agar hasil benchmark tidak bergantung pada isi cache di disk.
+    """
+    if cassette_mode:
+        return False
+    return os.environ.get("NUSANTARA_RESULT_CACHE", "1").strip().lower() not in ("0", "false", "off", "no")
+
+def _normalize(value):
+    return " ".join((value or "").split()).lower()
+
+def make_cache_key(judul_objek, lokasi_objek, deskripsi_kunci, target_audiens, gaya_bahasa):
+    """
+    Membuat kunci cache dari input form. Perbedaan huruf besar/kecil dan spasi diabaikan.
+    """
+    parts = [_normalize(v) for v in (judul_objek, lokasi_objek, deskripsi_kunci, target_audiens, gaya_bahasa)]
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+def _connect(db_path):
+    return connect_sqlite(db_path, _SCHEMA)
+
+def _ttl_seconds(ttl_seconds=None):
+    if ttl_seconds is not None:
+        return ttl_seconds
+    return env_int("NUSANTARA_RESULT_CACHE_TTL_SECONDS", DEFAULT_TTL_SECONDS)
+
+def has_cached_result(cache_key, db_path=None, ttl_seconds=None):
+    """
+    Mengecek apakah hasil warm-up yang masih berlaku tersedia, tanpa memuat isinya.
+    """
+    conn = _connect(db_path or RESULT_CACHE_DB_PATH)
+    try:
+        row = conn.execute(
+            "SELECT 1 FROM warmup_results WHERE cache_key = ? AND source = ? AND created_ts >= ?",
+            (cache_key, SOURCE_WARMUP, time.time() - _ttl_seconds(ttl_seconds)),
+        ).fetchone()
+    finally:
+        conn.close()
+    return row is not None
+
+def get_cached_result(cache_key, db_path=None, ttl_seconds=None):
+    """
+    Mengambil hasil warm-up dari cache. Mengembalikan dict berisi "narrative", "analysis",
+    "narasi_pdf", dan "analisis_pdf", atau None jika belum ada atau sudah kedaluwarsa.
+    """
+    ttl_seconds = _ttl_seconds(ttl_seconds)
+    conn = _connect(db_path or RESULT_CACHE_DB_PATH)
+    try:
+        row = conn.execute(
+            "SELECT payload, narasi_pdf, analisis_pdf FROM warmup_results "
+            "WHERE cache_key = ? AND source = ? AND created_ts >= ?",
+            (cache_key, SOURCE_WARMUP, time.time() - ttl_seconds),
+        ).fetchone()
+    finally:
+        conn.close()
+
+    if row is None:
+        return None
+    payload, narasi_pdf, analisis_pdf = row
+    result = json.loads(zlib.decompress(payload).decode("utf-8"))
+    result["narasi_pdf"] = narasi_pdf
+    result["analisis_pdf"] = analisis_pdf
+    return result
+
+def _prune(conn, ttl_seconds, max_rows):
+    # Hapus entri kedaluwarsa, lalu entri terlama jika jumlah baris melebihi batas
+    conn.execute("DELETE FROM warmup_results WHERE created_ts < ?", (time.time() - ttl_seconds,))
+    conn.execute(
+        "DELETE FROM warmup_results WHERE cache_key NOT IN "
+        "(SELECT cache_key FROM warmup_results ORDER BY created_ts DESC, rowid DESC LIMIT ?)",
+        (max_rows,),
+    )
+
+def store_cached_result(cache_key, judul_objek, narrative_text, analysis_data,
+                        narasi_pdf=None, analisis_pdf=None, db_path=None,
+                        ttl_seconds=None, max_rows=None):
+    """
+    Menyimpan (atau menimpa) hasil warm-up ke cache, lalu memangkas entri lama.
+    """
+    payload = json.dumps(
+        {"narrative": narrative_text, "analysis": analysis_data or {}},
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+    conn = _connect(db_path or RESULT_CACHE_DB_PATH)
+    try:
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO warmup_results (cache_key, source, created_at, created_ts, judul_objek, "
+                "payload, narasi_pdf, analisis_pdf) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    cache_key,
+                    SOURCE_WARMUP,
+                    datetime.now().isoformat(timespec="seconds"),
+                    time.time(),
+                    judul_objek,
+                    zlib.compress(payload, 9),
+                    narasi_pdf,
+                    analisis_pdf,
+                ),
+            )
+            _prune(
+                conn,
+                _ttl_seconds(ttl_seconds),
+                env_int("NUSANTARA_RESULT_CACHE_MAX_ROWS", DEFAULT_MAX_ROWS) if max_rows is None else max_rows,
+            )
+    finally:
+        conn.close()
@@ -0,0 +1,123 @@
+# utils/cassette_utils.py
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import datetime
+
+# Modul ini merekam pasangan prompt -> respons Gemini (beserta latensinya) ke file
+# JSONL terkompresi gzip, lalu bisa memutarnya ulang tanpa akses jaringan.
+# Kedua pembungkus punya method `generate_content` yang sama dengan model Gemini,
+# sehingga bisa langsung dipakai oleh fungsi di utils/gemini_utils.py.
+
+def _prompt_key(prompt, kwargs=None):
+    """
+    Menghasilkan kunci unik (SHA-256) untuk sebuah prompt beserta argumen tambahannya
+    (misal `generation_config`, `safety_settings`), agar replay tidak memakai respons
+    yang direkam dengan pengaturan berbeda.
+    """
+    if not isinstance(prompt, str):
+        prompt = json.dumps(prompt, sort_keys=True, default=str, ensure_ascii=False)
+    if kwargs:
+        prompt += "\x1f" + json.dumps(kwargs, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+def load_cassette_entries(cassette_path):
+    """
+    Membaca semua entri rekaman dari file cassette sesuai urutan perekaman.
+    """
+    entries = []
+    with gzip.open(cassette_path, "rt", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                entries.append(json.loads(line))
+    return entries
+
+class CassetteResponse:
+    """
+    Respons tiruan hasil replay. Hanya menyediakan atribut `text` seperti respons Gemini.
+    """
+    def __init__(self, text):
+        self.text = text
+
+class RecordingModel:
+    """
+    Membungkus model Gemini asli dan mencatat setiap pemanggilan `generate_content`
+    ke file cassette (append), termasuk waktu respons dalam detik.
+    """
+    def __init__(self, model, cassette_path):
+        self.model = model
+        self.cassette_path = cassette_path
+        self._lock = threading.Lock()
+        cassette_dir = os.path.dirname(cassette_path)
+        if cassette_dir:
+            os.makedirs(cassette_dir, exist_ok=True)
+
+    def generate_content(self, prompt, **kwargs):
+        start = time.perf_counter()
+        response = self.model.generate_content(prompt, **kwargs)
+        latency = time.perf_counter() - start
+
+        entry = {
+            "key": _prompt_key(prompt, kwargs),
+            "prompt": prompt if isinstance(prompt, str) else str(prompt),
+            "kwargs": json.loads(json.dumps(kwargs, default=str)),
+            "text": response.text,
+            "latency": round(latency, 4),
+            "recorded_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        # Setiap append menjadi satu member gzip baru; gzip tetap bisa membacanya sebagai satu aliran
+        with self._lock:
+            with gzip.open(self.cassette_path, "at", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        return response
+
+class ReplayModel:
+    """
+    Memutar ulang respons dari file cassette tanpa jaringan.
+    `latency_scale` mengalikan latensi asli (1.0 = sama seperti rekaman, 0 = tanpa jeda).
+    Jika prompt yang sama terekam beberapa kali, respons diputar bergiliran.
+    """
+    def __init__(self, cassette_path, latency_scale=1.0):
+        self.cassette_path = cassette_path
+        self.latency_scale = latency_scale
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._positions = {}
+
+        for entry in load_cassette_entries(cassette_path):
+            self._entries.setdefault(entry["key"], []).append(entry)
+
+    def __len__(self):
+        return sum(len(entries) for entries in self._entries.values())
+
+    def generate_content(self, prompt, **kwargs):
+        key = _prompt_key(prompt, kwargs)
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                raise LookupError(f"Prompt tidak ditemukan di cassette {self.cassette_path} (kunci {key[:12]}).")
+            position = self._positions.get(key, 0)
+            self._positions[key] = position + 1
+        entry = entries[position % len(entries)]
+
+        delay = entry.get("latency", 0) * self.latency_scale
+        if delay > 0:
+            time.sleep(delay)
+        return CassetteResponse(entry["text"])
+
+def wrap_model_with_cassette(model_factory, mode, cassette_path, latency_scale=1.0):
+    """
+    Mengembalikan model sesuai mode cassette:
+    - "record": model asli dari `model_factory()` yang dibungkus RecordingModel
+    - "replay": ReplayModel dari file cassette (model asli tidak dibuat sama sekali)
+    - lainnya: model asli tanpa pembungkus
+    """
+    if mode == "replay":
+        return ReplayModel(cassette_path, latency_scale=latency_scale)
+    if mode == "record":
+        return RecordingModel(model_factory(), cassette_path)
+    return model_factory()
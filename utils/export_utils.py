@@ -0,0 +1,328 @@
+# utils/export_utils.py
+import html
+import shutil
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from tempfile import SpooledTemporaryFile
+
+from reportlab.lib.pagesizes import letter
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.enums import TA_CENTER, TA_LEFT
+from reportlab.lib.units import inch
+
+# python-docx bersifat opsional; format DOCX dilewati jika library tidak terpasang
+try:
+    import docx
+except ImportError:
+    docx = None
+
+# Urutan bagian analisis, sama dengan yang ditampilkan di app.py
+ANALYSIS_SECTIONS = [
+    "Poin Jual Utama",
+    "Segmen Wisatawan Ideal",
+    "Ide Monetisasi & Produk Pariwisata",
+    "Saran Peningkatan Pesan Promosi",
+    "Potensi Kolaborasi Lokal",
+]
+
+# Batas ukuran (byte) sebelum hasil render dipindahkan dari memori ke file sementara
+SPOOL_MAX_SIZE = 1024 * 1024
+
+FOOTER_TEXT = "Nusantara Story AI. Dibuat dengan ✨ oleh Kholish Fauzan."
+
+def _as_text(value):
+    # None menjadi string kosong, nilai non-string lain diubah dengan str()
+    return "" if value is None else str(value)
+
+def _normalize_item(item):
+    """
+    Mengubah satu item analysis menjadi pasangan (poin, deskripsi) berupa string.
+    Gemini kadang mengembalikan string biasa alih-alih dict.
+    """
+    if isinstance(item, dict):
+        return _as_text(item.get("poin")), _as_text(item.get("deskripsi"))
+    return _as_text(item), ""
+
+def build_export_document(title, narrative_text, analysis_data):
+    """
+    Menyusun model dokumen perantara dari narasi dan data analisis.
+    Semua renderer format membaca struktur yang sama ini, dan semua nilainya sudah berupa string.
+    """
+    sections = []
+    if narrative_text:
+        paragraphs = [p.strip() for p in _as_text(narrative_text).split("\n") if p.strip()]
+        sections.append({"heading": "Kisah & Narasi", "paragraphs": paragraphs, "items": []})
+
+    if not isinstance(analysis_data, dict):
+        analysis_data = {}
+    for key in ANALYSIS_SECTIONS:
+        items = analysis_data.get(key) or []
+        if not isinstance(items, list):
+            items = [items]
+        items = [_normalize_item(item) for item in items if item is not None]
+        items = [(poin, deskripsi) for poin, deskripsi in items if poin or deskripsi]
+        if items:
+            sections.append({
+                "heading": key,
+                "paragraphs": [],
+                "items": items,
+            })
+
+    return {
+        "title": _as_text(title),
+        "sections": sections,
+        "footer": f"© {datetime.now().year} {FOOTER_TEXT}",
+    }
+
+def _split_item(poin, deskripsi):
+    """
+    Menentukan bagian tebal dan teks biasa sebuah item. Label tebal dan pemisah ": "
+    hanya dipakai jika poin dan deskripsi sama-sama ada.
+    Mengembalikan (teks tebal atau None, teks biasa).
+    """
+    if poin and deskripsi:
+        return poin, deskripsi
+    return None, poin or deskripsi
+
+def render_markdown(document, out):
+    """
+    Menulis dokumen sebagai Markdown ke `out` (stream biner).
+    """
+    def write(text):
+        out.write(text.encode("utf-8"))
+
+    write(f"# {document['title']}\n\n")
+    for section in document["sections"]:
+        write(f"## {section['heading']}\n\n")
+        for paragraph in section["paragraphs"]:
+            write(f"{paragraph}\n\n")
+        for poin, deskripsi in section["items"]:
+            bold, text = _split_item(poin, deskripsi)
+            write(f"- **{bold}**: {text}\n" if bold else f"- {text}\n")
+        if section["items"]:
+            write("\n")
+    write(f"---\n\n{document['footer']}\n")
+
+def render_html(document, out):
+    """
+    Menulis dokumen sebagai HTML mandiri ke `out` (stream biner).
+    """
+    def write(text):
+        out.write(text.encode("utf-8"))
+
+    title = html.escape(document["title"])
+    write(f'<!DOCTYPE html>\n<html lang="id">\n<head>\n<meta charset="utf-8">\n<title>{title}</title>\n</head>\n<body>\n')
+    write(f"<h1>{title}</h1>\n")
+    for section in document["sections"]:
+        write(f"<h2>{html.escape(section['heading'])}</h2>\n")
+        for paragraph in section["paragraphs"]:
+            write(f"<p>{html.escape(paragraph)}</p>\n")
+        if section["items"]:
+            write("<ul>\n")
+            for poin, deskripsi in section["items"]:
+                bold, text = _split_item(poin, deskripsi)
+                if bold:
+                    write(f"<li><strong>{html.escape(bold)}</strong>: {html.escape(text)}</li>\n")
+                else:
+                    write(f"<li>{html.escape(text)}</li>\n")
+            write("</ul>\n")
+    write(f"<hr>\n<p><small>{html.escape(document['footer'])}</small></p>\n</body>\n</html>\n")
+
+def render_docx(document, out):
+    """
+    Menulis dokumen sebagai DOCX ke `out` (stream biner). Membutuhkan python-docx.
+    """
+    word_doc = docx.Document()
+    word_doc.add_heading(document["title"], level=0)
+    for section in document["sections"]:
+        word_doc.add_heading(section["heading"], level=1)
+        for paragraph in section["paragraphs"]:
+            word_doc.add_paragraph(paragraph)
+        for poin, deskripsi in section["items"]:
+            bold, text = _split_item(poin, deskripsi)
+            item_paragraph = word_doc.add_paragraph(style="List Bullet")
+            if bold:
+                item_paragraph.add_run(bold).bold = True
+                item_paragraph.add_run(f": {text}")
+            else:
+                item_paragraph.add_run(text)
+    word_doc.add_paragraph(document["footer"])
+    word_doc.save(out)
+
+def render_pdf(document, out):
+    """
+    Menulis dokumen sebagai PDF terkompresi ke `out` (stream biner).
+    Memakai font standar PDF (Helvetica) yang tidak di-embed, sehingga tidak ada data font di file.
+    """
+    pdf_doc = SimpleDocTemplate(out, pagesize=letter, pageCompression=1, invariant=1, title=document["title"])
+    styles = getSampleStyleSheet()
+
+    title_style = ParagraphStyle(
+        'ExportTitleStyle',
+        parent=styles['h1'],
+        fontSize=24,
+        leading=28,
+        alignment=TA_CENTER,
+        spaceAfter=20
+    )
+    section_title_style = ParagraphStyle(
+        'ExportSectionTitleStyle',
+        parent=styles['h2'],
+        fontSize=18,
+        leading=22,
+        spaceAfter=10,
+        textColor='#34495E'
+    )
+    normal_style = ParagraphStyle(
+        'ExportNormalStyle',
+        parent=styles['Normal'],
+        fontSize=12,
+        leading=14,
+        alignment=TA_LEFT,
+        spaceAfter=12
+    )
+    footer_style = ParagraphStyle(
+        'ExportFooterStyle',
+        parent=styles['Normal'],
+        fontSize=9,
+        alignment=TA_CENTER,
+        textColor='#777777',
+        spaceBefore=30
+    )
+
+    story = [Paragraph(html.escape(document["title"]), title_style), Spacer(1, 0.2 * inch)]
+    for section in document["sections"]:
+        story.append(Paragraph(html.escape(section["heading"]), section_title_style))
+        for paragraph in section["paragraphs"]:
+            story.append(Paragraph(html.escape(paragraph), normal_style))
+        for poin, deskripsi in section["items"]:
+            bold, text = _split_item(poin, deskripsi)
+            if bold:
+                story.append(Paragraph(f"<b>{html.escape(bold)}</b>: {html.escape(text)}", normal_style))
+            else:
+                story.append(Paragraph(html.escape(text), normal_style))
+        story.append(Spacer(1, 0.2 * inch))
+    story.append(Paragraph(html.escape(document["footer"]), footer_style))
+
+    pdf_doc.build(story)
+
+# Nama format -> (ekstensi file, fungsi renderer)
+EXPORT_RENDERERS = {
+    "html": ("html", render_html),
+    "markdown": ("md", render_markdown),
+    "docx": ("docx", render_docx),
+    "pdf": ("pdf", render_pdf),
+}
+
+def available_export_formats():
+    """
+    Mengembalikan daftar format yang bisa dirender di lingkungan saat ini.
+    """
+    return [name for name in EXPORT_RENDERERS if name != "docx" or docx is not None]
+
+def _safe_file_name(name):
+    """
+    Membersihkan nama file dari pemisah path agar entri ZIP tidak membentuk folder.
+    """
+    for separator in ("/", "\\", ":"):
+        name = name.replace(separator, "_")
+    return name.strip(" .") or "Nusantara_Story"
+
+def _render_to_spool(document, format_name):
+    """
+    Merender satu format ke file sementara dan mencatat waktu serta ukurannya.
+    """
+    _, renderer = EXPORT_RENDERERS[format_name]
+    spool = SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    start = time.perf_counter()
+    renderer(document, spool)
+    elapsed = time.perf_counter() - start
+    size = spool.tell()
+    spool.seek(0)
+    return spool, {"seconds": round(elapsed, 4), "bytes": size}
+
+def export_bundle(document, base_name, formats=None, max_workers=4):
+    """
+    Merender beberapa format dari satu model dokumen lalu menggabungkannya ke satu arsip ZIP.
+    Mengembalikan (file ZIP yang siap dibaca dari awal, statistik per format).
+    Format yang gagal dirender dicatat di statistik dengan kunci "error".
+
+    Catatan: renderer adalah kode Python murni yang terikat CPU, sehingga thread di sini hanya
+    menumpangkan bagian I/O (tulis ke file sementara). Karena thread saling berebut GIL, nilai
+    "seconds" per format di statistik ini lebih besar dari waktu render sebenarnya; gunakan
+    benchmark_exports untuk angka per format dan benchmark_bundle untuk membandingkan
+    max_workers=1 (berurutan) dengan paralel.
+    """
+    if formats is None:
+        formats = available_export_formats()
+    base_name = _safe_file_name(base_name)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {name: executor.submit(_render_to_spool, document, name) for name in formats}
+
+    bundle = SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    stats = {}
+    with zipfile.ZipFile(bundle, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for name, future in futures.items():
+            try:
+                spool, stats[name] = future.result()
+            except Exception as e:
+                print(f"Error rendering {name} export: {e}")
+                stats[name] = {"error": str(e)}
+                continue
+            extension, _ = EXPORT_RENDERERS[name]
+            with spool, zf.open(f"{base_name}.{extension}", "w") as entry:
+                shutil.copyfileobj(spool, entry)
+
+    stats["zip"] = {"bytes": bundle.tell()}
+    bundle.seek(0)
+    return bundle, stats
+
+def benchmark_bundle(documents, rounds=3, max_workers=4):
+    """
+    Membandingkan waktu total export_bundle secara berurutan (max_workers=1) dan paralel.
+    Mengembalikan {"sequential": detik rata-rata per dokumen, "parallel": detik rata-rata per dokumen}.
+    """
+    results = {}
+    for label, workers in (("sequential", 1), ("parallel", max_workers)):
+        elapsed = 0.0
+        runs = 0
+        for _ in range(rounds):
+            for document in documents:
+                start = time.perf_counter()
+                bundle, _ = export_bundle(document, "benchmark", max_workers=workers)
+                elapsed += time.perf_counter() - start
+                bundle.close()
+                runs += 1
+        results[label] = round(elapsed / runs, 4) if runs else 0.0
+    return results
+
+def benchmark_exports(documents, formats=None, rounds=3):
+    """
+    Mengukur waktu render dan ukuran file per format untuk sekumpulan dokumen.
+    Setiap format dirender berurutan di thread pemanggil, jadi waktunya tidak terganggu thread lain.
+    Mengembalikan dict format -> {"seconds": rata-rata per dokumen, "bytes": rata-rata per dokumen}.
+    """
+    if formats is None:
+        formats = available_export_formats()
+
+    totals = {name: {"seconds": 0.0, "bytes": 0} for name in formats}
+    runs = 0
+    for _ in range(rounds):
+        for document in documents:
+            for name in formats:
+                spool, stats = _render_to_spool(document, name)
+                spool.close()
+                totals[name]["seconds"] += stats["seconds"]
+                totals[name]["bytes"] += stats["bytes"]
+            runs += 1
+
+    if not runs:
+        return totals
+    return {
+        name: {"seconds": round(total["seconds"] / runs, 4), "bytes": total["bytes"] // runs}
+        for name, total in totals.items()
+    }
@@ -66,6 +66,19 @@ def generate_narrative(model, judul_objek, lokasi_objek, deskripsi_kunci, target
         st.error(f"Terjadi kesalahan saat menghasilkan narasi: {e}. Pastikan API Key valid dan model berfungsi.")
         return None
 
+def parse_analysis_json(response_text):
+    """
+    Mengurai teks respons analisis menjadi dict, membuang pembungkus markdown ```json jika ada.
+    """
+    # Mencoba membersihkan respons jika ada markdown atau teks tambahan
+    json_text = response_text.strip()
+    if json_text.startswith("```json"):
+        json_text = json_text[len("```json"):].strip()
+    if json_text.endswith("```"):
+        json_text = json_text[:-len("```")].strip()
+
+    return json.loads(json_text)
+
 def generate_analysis_data(model, lokasi_objek, narrative_text):
     """
     Menganalisis narasi yang dihasilkan untuk memberikan wawasan promosi dan monetisasi.
@@ -106,14 +119,7 @@ def generate_analysis_data(model, lokasi_objek, narrative_text):
     """
     try:
         response = model.generate_content(prompt)
-        # Mencoba membersihkan respons jika ada markdown atau teks tambahan
-        json_text = response.text.strip()
-        if json_text.startswith("```json"):
-            json_text = json_text[len("```json"):].strip()
-        if json_text.endswith("```"):
-            json_text = json_text[:-len("```")].strip()
-
-        return json.loads(json_text)
+        return parse_analysis_json(response.text)
     except json.JSONDecodeError as e:
         st.error(f"Gagal mengurai respons AI sebagai JSON. Mohon coba lagi. Error: {e}")
         st.write("Respons AI mentah (untuk debugging):", response.text)
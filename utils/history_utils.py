@@ -0,0 +1,201 @@
+# utils/history_utils.py
+import json
+import os
+import zlib
+from datetime import datetime, timedelta
+
+from utils.storage_utils import connect_sqlite, env_int
+
+# zstandard bersifat opsional; jika tidak terpasang, riwayat dikompresi dengan zlib
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Lokasi database riwayat (bisa diubah lewat environment variable)
+HISTORY_DB_PATH = os.environ.get("NUSANTARA_HISTORY_DB_PATH", "data/history.sqlite3")
+
+# Kuota dibaca dari environment variable saat dipakai, lihat _history_limits()
+DEFAULT_MAX_ENTRIES = 50                       # per pengguna
+DEFAULT_MAX_BYTES = 2 * 1024 * 1024            # per pengguna
+DEFAULT_MAX_AGE_DAYS = 90                      # semua pengguna; riwayat uid yang ditinggalkan ikut terhapus
+DEFAULT_MAX_TOTAL_BYTES = 200 * 1024 * 1024    # semua pengguna
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    judul_objek TEXT NOT NULL,
+    lokasi_objek TEXT NOT NULL,
+    target_audiens TEXT NOT NULL,
+    gaya_bahasa TEXT NOT NULL,
+    codec TEXT NOT NULL,
+    raw_size INTEGER NOT NULL,
+    stored_size INTEGER NOT NULL,
+    payload BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_history_user ON history (user_id, id);
+"""
+
+def _connect(db_path):
+    return connect_sqlite(db_path, _SCHEMA)
+
+def _history_limits():
+    return {
+        "max_entries": env_int("NUSANTARA_HISTORY_MAX_ENTRIES", DEFAULT_MAX_ENTRIES),
+        "max_bytes": env_int("NUSANTARA_HISTORY_MAX_BYTES", DEFAULT_MAX_BYTES),
+        "max_age_days": env_int("NUSANTARA_HISTORY_MAX_AGE_DAYS", DEFAULT_MAX_AGE_DAYS),
+        "max_total_bytes": env_int("NUSANTARA_HISTORY_MAX_TOTAL_BYTES", DEFAULT_MAX_TOTAL_BYTES),
+    }
+
+def _compress(raw):
+    if zstandard is not None:
+        return "zstd", zstandard.ZstdCompressor(level=10).compress(raw)
+    return "zlib", zlib.compress(raw, 9)
+
+def _decompress(codec, data):
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("Entri riwayat dikompresi dengan zstd, tetapi paket zstandard tidak terpasang.")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+def _enforce_quota(conn, user_id, max_entries, max_bytes):
+    """
+    Menghapus entri terlama milik pengguna sampai jumlah dan total ukurannya sesuai kuota.
+    Entri terbaru selalu dipertahankan.
+    """
+    rows = conn.execute(
+        "SELECT id, stored_size FROM history WHERE user_id = ? ORDER BY id DESC",
+        (user_id,),
+    ).fetchall()
+
+    evicted_ids = []
+    total_bytes = 0
+    for index, (entry_id, stored_size) in enumerate(rows):
+        total_bytes += stored_size
+        if index > 0 and (index >= max_entries or total_bytes > max_bytes):
+            evicted_ids.append((entry_id,))
+    if evicted_ids:
+        conn.executemany("DELETE FROM history WHERE id = ?", evicted_ids)
+    return len(evicted_ids)
+
+def _enforce_global_limits(conn, keep_id, max_age_days, max_total_bytes):
+    """
+    Batas untuk seluruh database: menghapus entri yang lebih tua dari `max_age_days`, lalu entri
+    terlama dari pengguna mana pun sampai total ukuran tersimpan tidak melebihi `max_total_bytes`.
+    Entri `keep_id` (yang baru disimpan) tidak pernah dihapus.
+    """
+    cutoff = (datetime.now() - timedelta(days=max_age_days)).isoformat(timespec="seconds")
+    expired = conn.execute(
+        "DELETE FROM history WHERE created_at < ? AND id != ?", (cutoff, keep_id)
+    ).rowcount
+
+    rows = conn.execute("SELECT id, stored_size FROM history ORDER BY id DESC").fetchall()
+    evicted_ids = []
+    total_bytes = 0
+    for entry_id, stored_size in rows:
+        total_bytes += stored_size
+        if entry_id != keep_id and total_bytes > max_total_bytes:
+            evicted_ids.append((entry_id,))
+    if evicted_ids:
+        conn.executemany("DELETE FROM history WHERE id = ?", evicted_ids)
+    return expired + len(evicted_ids)
+
+def save_history_entry(user_id, judul_objek, lokasi_objek, target_audiens, gaya_bahasa,
+                       narrative_text, analysis_data, db_path=None,
+                       max_entries=None, max_bytes=None, max_age_days=None, max_total_bytes=None):
+    """
+    Menyimpan satu hasil generasi (narasi + analisis) secara terkompresi ke riwayat pengguna.
+    Mengembalikan id entri baru.
+    """
+    db_path = db_path or HISTORY_DB_PATH
+    payload = json.dumps(
+        {"narrative": narrative_text, "analysis": analysis_data or {}},
+        ensure_ascii=False,
+    ).encode("utf-8")
+    codec, compressed = _compress(payload)
+
+    conn = _connect(db_path)
+    try:
+        with conn:
+            cursor = conn.execute(
+                "INSERT INTO history (user_id, created_at, judul_objek, lokasi_objek, target_audiens, "
+                "gaya_bahasa, codec, raw_size, stored_size, payload) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    user_id,
+                    datetime.now().isoformat(timespec="seconds"),
+                    judul_objek,
+                    lokasi_objek,
+                    target_audiens or "",
+                    gaya_bahasa or "",
+                    codec,
+                    len(payload),
+                    len(compressed),
+                    compressed,
+                ),
+            )
+            limits = _history_limits()
+            _enforce_quota(
+                conn,
+                user_id,
+                max_entries if max_entries is not None else limits["max_entries"],
+                max_bytes if max_bytes is not None else limits["max_bytes"],
+            )
+            _enforce_global_limits(
+                conn,
+                cursor.lastrowid,
+                max_age_days if max_age_days is not None else limits["max_age_days"],
+                max_total_bytes if max_total_bytes is not None else limits["max_total_bytes"],
+            )
+            return cursor.lastrowid
+    finally:
+        conn.close()
+
+def list_history(user_id, page=0, page_size=5, db_path=None):
+    """
+    Mengambil satu halaman metadata riwayat (terbaru lebih dulu) tanpa memuat isi narasi.
+    Mengembalikan (daftar entri, jumlah total entri).
+    """
+    conn = _connect(db_path or HISTORY_DB_PATH)
+    try:
+        total = conn.execute("SELECT COUNT(*) FROM history WHERE user_id = ?", (user_id,)).fetchone()[0]
+        rows = conn.execute(
+            "SELECT id, created_at, judul_objek, lokasi_objek, target_audiens, gaya_bahasa, raw_size, stored_size "
+            "FROM history WHERE user_id = ? ORDER BY id DESC LIMIT ? OFFSET ?",
+            (user_id, page_size, page * page_size),
+        ).fetchall()
+    finally:
+        conn.close()
+
+    keys = ["id", "created_at", "judul_objek", "lokasi_objek", "target_audiens", "gaya_bahasa", "raw_size", "stored_size"]
+    return [dict(zip(keys, row)) for row in rows], total
+
+def load_history_entry(user_id, entry_id, db_path=None):
+    """
+    Memuat dan mendekompresi satu entri riwayat milik pengguna.
+    Mengembalikan dict berisi metadata, "narrative", dan "analysis", atau None jika tidak ditemukan.
+    """
+    conn = _connect(db_path or HISTORY_DB_PATH)
+    try:
+        row = conn.execute(
+            "SELECT judul_objek, lokasi_objek, target_audiens, gaya_bahasa, codec, payload "
+            "FROM history WHERE user_id = ? AND id = ?",
+            (user_id, entry_id),
+        ).fetchone()
+    finally:
+        conn.close()
+
+    if row is None:
+        return None
+    judul_objek, lokasi_objek, target_audiens, gaya_bahasa, codec, payload = row
+    entry = json.loads(_decompress(codec, payload).decode("utf-8"))
+    entry.update({
+        "id": entry_id,
+        "judul_objek": judul_objek,
+        "lokasi_objek": lokasi_objek,
+        "target_audiens": target_audiens,
+        "gaya_bahasa": gaya_bahasa,
+    })
+    return entry
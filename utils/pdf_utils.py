@@ -12,7 +12,7 @@ def generate_pdf_from_text(text_content, title="Dokumen Streamlit"):
     Menghasilkan file PDF dari string teks yang diberikan.
     """
     buffer = BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter)
+    doc = SimpleDocTemplate(buffer, pagesize=letter, pageCompression=1)
     styles = getSampleStyleSheet()
     story = []
 
@@ -53,7 +53,7 @@ def generate_analysis_pdf(analysis_data, title="Analisis Promosi"):
     Menghasilkan file PDF dari data analisis yang diberikan dalam format yang terstruktur.
     """
     buffer = BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter)
+    doc = SimpleDocTemplate(buffer, pagesize=letter, pageCompression=1)
     styles = getSampleStyleSheet()
     story = []
 
@@ -0,0 +1,28 @@
+# utils/storage_utils.py
+import os
+import sqlite3
+
+def env_int(name, default):
+    """
+    Membaca environment variable bilangan bulat saat dibutuhkan (bukan saat import).
+    Nilai tidak valid tidak boleh menggagalkan aplikasi; kembali ke nilai default.
+    """
+    raw_value = os.environ.get(name)
+    if raw_value is None or not raw_value.strip():
+        return default
+    try:
+        return int(raw_value)
+    except ValueError:
+        print(f"{name} tidak valid ({raw_value!r}), memakai {default}.")
+        return default
+
+def connect_sqlite(db_path, schema):
+    """
+    Membuka koneksi SQLite (membuat folder jika perlu) dan memastikan skema tabel sudah ada.
+    """
+    db_dir = os.path.dirname(db_path)
+    if db_dir:
+        os.makedirs(db_dir, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.executescript(schema)
+    return conn
@@ -0,0 +1,84 @@
+# utils/warmup_utils.py
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from utils.cache_utils import make_cache_key, get_cached_result, store_cached_result
+from utils.export_utils import build_export_document, export_bundle
+from utils.gemini_utils import generate_narrative, generate_analysis_data
+from utils.pdf_utils import generate_pdf_from_text, generate_analysis_pdf
+
+WARMUP_MANIFEST_PATH = "warmup_manifest.json"
+
+def load_manifest(manifest_path=None):
+    """
+    Membaca daftar objek populer dari file manifest JSON.
+    Entri yang sama juga ditampilkan di app.py sebagai tombol contoh, agar input pengguna cocok dengan cache.
+    """
+    with open(manifest_path or WARMUP_MANIFEST_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+def prime_rendering():
+    """
+    Merender dokumen kecil sekali agar font, style ReportLab, dan renderer ekspor
+    sudah dimuat sebelum permintaan pertama pengguna.
+    """
+    sample_analysis = {"Poin Jual Utama": [{"poin": "Pemanasan", "deskripsi": "Dokumen contoh."}]}
+    generate_pdf_from_text("Pemanasan.", "Pemanasan")
+    generate_analysis_pdf(sample_analysis, "Pemanasan")
+    export_zip, _ = export_bundle(build_export_document("Pemanasan", "Pemanasan.", sample_analysis), "Pemanasan")
+    export_zip.close()
+
+def warm_up_entry(model, entry, force=False):
+    """
+    Menghasilkan narasi, analisis, dan PDF untuk satu entri manifest lalu menyimpannya ke cache.
+    Mengembalikan status: "cached" (sudah ada), "generated", atau "failed".
+    """
+    judul_objek = entry["judul_objek"]
+    lokasi_objek = entry["lokasi_objek"]
+    deskripsi_kunci = entry["deskripsi_kunci"]
+    target_audiens = entry.get("target_audiens", "")
+    gaya_bahasa = entry.get("gaya_bahasa", "Pilih Gaya")
+
+    cache_key = make_cache_key(judul_objek, lokasi_objek, deskripsi_kunci, target_audiens, gaya_bahasa)
+    if not force and get_cached_result(cache_key):
+        return "cached"
+
+    narrative = generate_narrative(model, judul_objek, lokasi_objek, deskripsi_kunci, target_audiens, gaya_bahasa)
+    if not narrative:
+        return "failed"
+    analysis = generate_analysis_data(model, lokasi_objek, narrative)
+    if not analysis:
+        return "failed"
+
+    store_cached_result(
+        cache_key,
+        judul_objek,
+        narrative,
+        analysis,
+        narasi_pdf=generate_pdf_from_text(narrative, f"Narasi_{judul_objek}"),
+        analisis_pdf=generate_analysis_pdf(analysis, f"Analisis_{judul_objek}"),
+    )
+    return "generated"
+
+def run_warmup(model, entries, concurrency=4, force=False):
+    """
+    Menjalankan warm_up_entry untuk semua entri manifest dengan jumlah pemanggilan
+    model paralel dibatasi oleh `concurrency`.
+    Mengembalikan daftar (judul_objek, status, durasi dalam detik).
+    """
+    def timed(entry):
+        start = time.perf_counter()
+        try:
+            status = warm_up_entry(model, entry, force=force)
+        except Exception as e:
+            print(f"Error warming up {entry.get('judul_objek')}: {e}")
+            status = "failed"
+        return entry.get("judul_objek"), status, round(time.perf_counter() - start, 2)
+
+    results = []
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        futures = [executor.submit(timed, entry) for entry in entries]
+        for future in as_completed(futures):
+            results.append(future.result())
+    return results
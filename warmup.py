@@ -0,0 +1,26 @@
+# warmup.py
+# Mengisi cache hasil dengan konten populer saat deploy, agar pengguna pertama tidak menunggu Gemini.
+# Contoh: python warmup.py --manifest warmup_manifest.json --concurrency 4
+import argparse
+import sys
+
+from config import get_gemini_model
+from utils.warmup_utils import WARMUP_MANIFEST_PATH, load_manifest, run_warmup
+
+def main():
+    parser = argparse.ArgumentParser(description="Pra-generasi narasi, analisis, dan PDF ke cache hasil.")
+    parser.add_argument("--manifest", default=WARMUP_MANIFEST_PATH, help="File JSON berisi daftar objek populer.")
+    parser.add_argument("--concurrency", type=int, default=4, help="Jumlah maksimum pemanggilan model paralel.")
+    parser.add_argument("--force", action="store_true", help="Generate ulang meskipun sudah ada di cache.")
+    args = parser.parse_args()
+
+    entries = load_manifest(args.manifest)
+    results = run_warmup(get_gemini_model(), entries, concurrency=args.concurrency, force=args.force)
+
+    for judul_objek, status, seconds in results:
+        print(f"{status:>9}  {seconds:>7.2f}s  {judul_objek}")
+    failed = [r for r in results if r[1] == "failed"]
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())